@@ -4,67 +4,223 @@ Allows customization of the AI system prompt via the admin interface.
 """
 
 import json
+import mmap
 import os
 import logging
+import sys
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
-# Default prompt from ulrich_system_prompt.py
-DEFAULT_SYSTEM_PROMPT = """You are RBL AI, and your purpose is to help users access The RBL Group and Dave Ulrich's decades of research and resources. Your responses should reflect The RBL Group's deep experience with organizational development, human resources, and leadership.
-
-Your primary purpose is to help users access the RBL Group's resources (documents, videos, white papers, playbooks, etc.) to solve their business needs. Do not attempt to answer the user's questions; rather, provide and summarize documents that are most likely to answer the user's request. If you do not have documents that sufficiently answer the user's request, admit the limitation but provide materials that are the closest match. Do not provide any information, frameworks, explanations, or guides that are not contained in the documents you provide to the user.
-
-**CRITICAL RULE** Always follow these steps when responding to users:
-1. Provide a brief intro (1-2 sentences) explaining the resources that address the query
-2. List each UNIQUE document that addresses the user's query ONCE with:
-   - **Display Name**
-   - 2-3 sentence summary of relevant content
-3. NEVER create multiple entries for the same document
-4. Focus on presenting and summarizing the existing materials cleanly, do not attempt to synthesize 
-
-RESPONSE GUIDELINES:
-• List UNIQUE documents only - ONE entry per document (never repeat the same document)
-• Use display names from context, NOT filenames
-• Keep the intro concise - the focus is on presenting resources, not teaching
-• Let users explore the actual documents for deep learning
-
-FORMATTING GUIDELINES:
-• Use third-person and second-person only, do not use "I" or other first-person language
-• Prioritize conciseness
-• Use **bold** for key concepts, document titles, and important terms
-• Use bullet points for lists and frameworks
-• Structure responses with clear sections when appropriate
-• Keep paragraphs concise (2-3 sentences max)
-• Use numbered lists for sequential steps or priorities
-
-TONE:
-• Professional but approachable
-• Confident without being prescriptive"""
+
+def _loads(data: bytes) -> dict:
+    """Parse config JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: dict) -> bytes:
+    """Encode config to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode('utf-8')
+
 
 # Config file path
 CONFIG_DIR = Path(__file__).parent
 CONFIG_FILE = CONFIG_DIR / "system_prompt.json"
 
+# Prompt bodies live alongside the config instead of as module-level
+# string literals, so importers don't pay for the multi-KB blobs until
+# they are actually needed and the pages are shared via the OS page cache.
+# system_prompt_default.txt is the authoritative default; the dual-mode
+# (teacher/assistant) variant is kept here too so there is a single
+# source of truth for all prompt text.
+DEFAULT_PROMPT_FILE = CONFIG_DIR / "system_prompt_default.txt"
+DUAL_MODE_PROMPT_FILE = CONFIG_DIR / "system_prompt_dual_mode.txt"
+
+_default_prompt = None
+_default_prompt_bytes = None
+_dual_mode_prompt = None
+
+
+def _read_prompt_file(path: Path) -> str:
+    """Read a prompt text file via a read-only mmap and decode it once."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        try:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return mm[:].decode('utf-8').rstrip()
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
+
+
+def get_default_prompt() -> str:
+    """
+    Get the default system prompt (for reset functionality).
+    Lazily loads the prompt file on first access and caches the decoded
+    string for the lifetime of the process.
+    """
+    global _default_prompt
+    if _default_prompt is None:
+        # Interned so the process holds a single copy no matter how many
+        # places end up referencing it.
+        _default_prompt = sys.intern(_read_prompt_file(DEFAULT_PROMPT_FILE))
+    return _default_prompt
+
+
+def _get_default_prompt_bytes() -> bytes:
+    """UTF-8 encoding of the default prompt, computed once per process."""
+    global _default_prompt_bytes
+    if _default_prompt_bytes is None:
+        _default_prompt_bytes = get_default_prompt().encode('utf-8')
+    return _default_prompt_bytes
+
+
+def get_dual_mode_prompt() -> str:
+    """
+    Get the dual-mode (teacher/assistant) system prompt variant.
+    """
+    global _dual_mode_prompt
+    if _dual_mode_prompt is None:
+        _dual_mode_prompt = _read_prompt_file(DUAL_MODE_PROMPT_FILE)
+    return _dual_mode_prompt
+
+
+# In-memory cache of the parsed prompt, keyed by the config file's mtime.
+# get_system_prompt() is called on every chat request, so avoid re-reading
+# and re-parsing the config file unless it has actually changed on disk.
+_CACHE = {"mtime": -1, "prompt": None, "prompt_bytes": None}
+_cache_lock = threading.Lock()
+
+
+def _invalidate_cache():
+    """Force the next get_system_prompt() call to re-read the config file."""
+    with _cache_lock:
+        _CACHE["mtime"] = -1
+
 
 def get_system_prompt() -> str:
     """
     Get the current system prompt.
     Returns custom prompt if configured, otherwise returns default.
+    The result is cached in memory and refreshed only when the config
+    file's mtime changes.
     """
     try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                custom_prompt = config.get('custom_prompt')
-                if custom_prompt and custom_prompt.strip():
-                    logger.info("Using custom system prompt")
-                    return custom_prompt
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("No system prompt config file; using default")
+        return get_default_prompt()
+
+    with _cache_lock:
+        if mtime == _CACHE["mtime"]:
+            cached = _CACHE["prompt"]
+            return cached if cached is not None else get_default_prompt()
+
+    try:
+        data = CONFIG_FILE.read_bytes()
+    except (FileNotFoundError, OSError):
+        # File vanished between the stat and the read; fall back to default.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("System prompt config file vanished; using default")
+        return get_default_prompt()
+
+    try:
+        config = _loads(data)
+        if 'is_default' not in config:
+            # Old-format file: rewrite it through set_system_prompt()
+            # once so future reads only branch on the boolean.
+            logger.info("Migrating system prompt config to normalized schema")
+            custom_prompt = (config.get('custom_prompt') or '').strip()
+            if set_system_prompt(custom_prompt):
+                return get_system_prompt()
+            return custom_prompt or get_default_prompt()
+        # The writer guarantees a stripped value and a consistent flag,
+        # so the fast path is a dict lookup and a truthiness check.
+        prompt = None if config['is_default'] else (config.get('custom_prompt') or None)
+        logger.info(
+            "System prompt cache refreshed: using %s prompt",
+            "custom" if prompt is not None else "default"
+        )
+        with _cache_lock:
+            _CACHE["mtime"] = mtime
+            _CACHE["prompt"] = prompt
+            _CACHE["prompt_bytes"] = (
+                prompt.encode('utf-8') if prompt is not None else None
+            )
+        return prompt if prompt is not None else get_default_prompt()
     except Exception as e:
-        logger.error(f"Error reading system prompt config: {e}")
+        logger.error("Error reading system prompt config: %s", e)
+
+    return get_default_prompt()
+
+
+def get_system_prompt_bytes() -> bytes:
+    """
+    Get the current system prompt as UTF-8 bytes.
+    The encoding happens once per config change, not per call, for
+    consumers that forward the prompt straight to the wire.
+    """
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return _get_default_prompt_bytes()
+
+    with _cache_lock:
+        if mtime == _CACHE["mtime"]:
+            cached = _CACHE["prompt_bytes"]
+            return cached if cached is not None else _get_default_prompt_bytes()
+
+    # Cache is stale; refresh through the string path, then return the
+    # freshest cached value. The captured mtime may already be outdated
+    # if the config was rewritten concurrently, so don't compare it here.
+    get_system_prompt()
+    with _cache_lock:
+        cached = _CACHE["prompt_bytes"]
+    return cached if cached is not None else _get_default_prompt_bytes()
 
-    logger.info("Using default system prompt")
-    return DEFAULT_SYSTEM_PROMPT
+
+# Anonymous shared mmap backing the current prompt bytes, written once
+# per config change. Handing out memoryviews lets HTTP clients that take
+# raw bodies consume the prompt without another encode or copy.
+_VIEW = {"source": None, "mm": None, "view": None}
+
+
+def get_system_prompt_view() -> memoryview:
+    """
+    Get a read-only view of the current prompt's UTF-8 bytes, backed by
+    a shared anonymous mmap. The region is rebuilt only when the config
+    changes; callers holding an old view keep a valid buffer until they
+    drop it.
+    """
+    encoded = get_system_prompt_bytes()
+    with _cache_lock:
+        if _VIEW["source"] is encoded:
+            return _VIEW["view"]
+
+    mm = mmap.mmap(-1, len(encoded))
+    mm[:] = encoded
+    view = memoryview(mm).toreadonly()[:len(encoded)]
+    with _cache_lock:
+        # The previous mmap is intentionally not closed: exported views
+        # may still reference it, and it is freed once they are dropped.
+        _VIEW["source"] = encoded
+        _VIEW["mm"] = mm
+        _VIEW["view"] = view
+    return view
 
 
 def set_system_prompt(prompt: str) -> bool:
@@ -73,13 +229,24 @@ def set_system_prompt(prompt: str) -> bool:
     Pass empty string to reset to default.
     """
     try:
-        config = {'custom_prompt': prompt if prompt.strip() else ''}
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Store the normalized value plus a precomputed default flag so
+        # readers never need to re-strip or re-derive emptiness.
+        stripped = prompt.strip()
+        config = {'custom_prompt': stripped, 'is_default': not stripped}
+        # Write to a temp file and rename into place so readers (and the
+        # mtime cache) only ever see a complete old or new config, never
+        # a torn write.
+        tmp_file = CONFIG_FILE.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps(config))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, CONFIG_FILE)
+        _invalidate_cache()
         logger.info("System prompt updated successfully")
         return True
     except Exception as e:
-        logger.error(f"Error saving system prompt: {e}")
+        logger.error("Error saving system prompt: %s", e)
         return False
 
 
@@ -88,10 +255,3 @@ def reset_system_prompt() -> bool:
     Reset to the default system prompt.
     """
     return set_system_prompt('')
-
-
-def get_default_prompt() -> str:
-    """
-    Get the default system prompt (for reset functionality).
-    """
-    return DEFAULT_SYSTEM_PROMPT